@@ -0,0 +1,588 @@
+"""SQLAlchemy-backed persistence layer for the Pets × AI service.
+
+The ORM models here mirror the tables created by
+``infra/migrations/001_create_tables.sql``.  For local development the
+service runs against SQLite; in production the same models target the
+Postgres instance provisioned by ``infra/compose.yaml``.  Identifiers are
+stored as strings for portability between the two backends.
+
+Helper functions in this module take an open :class:`~sqlalchemy.orm.Session`
+as their first argument; request handlers obtain one via the ``get_session``
+dependency in :mod:`api.main` and the edge consumer via
+:func:`session_scope`.
+"""
+
+from __future__ import annotations
+
+import json
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid_utils import uuid7
+
+from sqlalchemy import (
+    JSON,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    String,
+    create_engine,
+    event,
+    func,
+    insert,
+    lambda_stmt,
+    select,
+)
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    Session,
+    mapped_column,
+    raiseload,
+    relationship,
+    selectinload,
+    sessionmaker,
+)
+
+from .models import (
+    Alert,
+    CaseDetail,
+    CaseExport,
+    CaseReview,
+    CreateCaseRequest,
+    CreateCaseResponse,
+    EventRecord,
+    LitterEventPayload,
+    PhotoMetadata,
+    PhotoUploadResponse,
+    PlayroomAlertPayload,
+    ReviewRequest,
+    SearchCandidate,
+)
+
+# Litter/feeder interactions longer than this are considered anomalous and
+# raise a health alert (see AC-MP-1 in the README).
+LITTER_DURATION_ALERT_S = 120.0
+
+
+@dataclass(slots=True)
+class AlertRow:
+    """Read-only alert DTO for the list/feed endpoints.
+
+    A plain slotted dataclass: no validator chain, no schema lookup, and
+    orjson serializes it natively.  The Pydantic :class:`~api.models.Alert`
+    model remains the contract type on ingestion and in the OpenAPI docs.
+    """
+
+    id: str
+    pet_id: str
+    room_id: Optional[str]
+    kind: str
+    severity: str
+    state: str
+    evidence_url: Optional[str]
+    ts: datetime
+    created_at: datetime
+
+
+@dataclass(slots=True)
+class EventRow:
+    """Read-only event DTO for the list/feed endpoints."""
+
+    id: str
+    source: str
+    pet_id: str
+    type: str
+    ts: datetime
+    duration_s: Optional[float]
+    conf: Optional[float]
+    payload_json: Optional[Dict[str, Any]]
+    created_at: datetime
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class CaseRecord(Base):
+    __tablename__ = "cases"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True, default=lambda: uuid7().hex)
+    user_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    # Correlation key linking the case to edge events/alerts for the same pet.
+    pet_id: Mapped[Optional[str]] = mapped_column(String(36))
+    type: Mapped[str] = mapped_column(String(16), nullable=False)
+    species: Mapped[str] = mapped_column(String(32), nullable=False)
+    geohash6: Mapped[str] = mapped_column(String(6), nullable=False)
+    consent_json: Mapped[dict] = mapped_column(JSON, nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False, default="open")
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    photos: Mapped[List["PhotoRecord"]] = relationship(
+        back_populates="case", cascade="all, delete-orphan"
+    )
+
+
+class PhotoRecord(Base):
+    __tablename__ = "photos"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True, default=lambda: uuid7().hex)
+    case_id: Mapped[str] = mapped_column(ForeignKey("cases.id", ondelete="CASCADE"), nullable=False)
+    filename: Mapped[Optional[str]] = mapped_column(String(255))
+    view: Mapped[Optional[str]] = mapped_column(String(32))
+    hash: Mapped[Optional[str]] = mapped_column(String(64))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    case: Mapped[CaseRecord] = relationship(back_populates="photos")
+
+
+class EventRecordORM(Base):
+    __tablename__ = "events"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True, default=lambda: uuid7().hex)
+    source: Mapped[str] = mapped_column(String(128), nullable=False)
+    pet_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
+    type: Mapped[str] = mapped_column(String(32), nullable=False)
+    ts: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+    duration_s: Mapped[Optional[float]] = mapped_column(Float)
+    conf: Mapped[Optional[float]] = mapped_column(Float)
+    payload_json: Mapped[Optional[dict]] = mapped_column(JSON)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+class AlertRecord(Base):
+    __tablename__ = "alerts"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True, default=lambda: uuid7().hex)
+    pet_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
+    room_id: Mapped[Optional[str]] = mapped_column(String(64))
+    kind: Mapped[str] = mapped_column(String(32), nullable=False)
+    severity: Mapped[str] = mapped_column(String(16), nullable=False)
+    state: Mapped[str] = mapped_column(String(16), nullable=False)
+    evidence_url: Mapped[Optional[str]] = mapped_column(String(512))
+    ts: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+class CaseReviewRecord(Base):
+    __tablename__ = "case_reviews"
+    # Covers the list_case_reviews filter+sort in one index scan.
+    __table_args__ = (Index("ix_case_reviews_case_created", "case_id", "created_at"),)
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True, default=lambda: uuid7().hex)
+    case_id: Mapped[str] = mapped_column(ForeignKey("cases.id", ondelete="CASCADE"), nullable=False)
+    pet_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    decision: Mapped[str] = mapped_column(String(16), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+_engine = None
+_SessionLocal: Optional[sessionmaker] = None
+
+
+def configure(database_url: str) -> None:
+    """Create the engine/sessionmaker and ensure tables exist.
+
+    Safe to call more than once; reconfiguring with a different URL swaps
+    the engine (useful for tests).
+    """
+    global _engine, _SessionLocal
+    # query_cache_size is explicit so the lambda statements used by the hot
+    # list queries stay cached even under a large working set.
+    kwargs: dict = {"pool_pre_ping": True, "query_cache_size": 1200}
+    is_sqlite = database_url.startswith("sqlite")
+    if is_sqlite:
+        # SQLite defaults to a per-thread pool; a shared QueuePool plus WAL
+        # lets concurrent FastAPI workers read while one writer commits.
+        kwargs.update(
+            poolclass=QueuePool,
+            pool_size=10,
+            max_overflow=20,
+            connect_args={"check_same_thread": False},
+        )
+    else:
+        kwargs.update(pool_size=10, max_overflow=20, pool_recycle=1800)
+    _engine = create_engine(database_url, **kwargs)
+    if is_sqlite:
+
+        @event.listens_for(_engine, "connect")
+        def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA mmap_size=268435456")
+            cursor.close()
+
+    _SessionLocal = sessionmaker(bind=_engine, expire_on_commit=False)
+    Base.metadata.create_all(_engine)
+
+
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """Provide a transactional scope around a series of operations."""
+    if _SessionLocal is None:
+        raise RuntimeError("database.configure() has not been called")
+    session = _SessionLocal()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def _finish_write(session: Session, commit: bool) -> None:
+    """Commit the write, or just flush when the caller owns the transaction.
+
+    The edge consumer batches several writes per message and lets its
+    ``session_scope`` commit once on exit; flushing here still assigns
+    defaults and IDs without paying an fsync per helper call.
+    """
+    if commit:
+        session.commit()
+    else:
+        session.flush()
+
+
+def create_case(
+    session: Session, data: CreateCaseRequest, *, _commit: bool = True
+) -> CreateCaseResponse:
+    """Persist a new case and return its identifier.
+
+    The INSERT uses ``returning()`` so the generated ID comes back with
+    the statement itself — no post-commit refresh round trip.
+    """
+    case_id = session.execute(
+        insert(CaseRecord)
+        .values(
+            user_id=data.user_id,
+            pet_id=data.pet_id,
+            type=data.type,
+            species=data.species,
+            geohash6=data.geohash6,
+            consent_json=data.consent.model_dump(mode="json"),
+        )
+        .returning(CaseRecord.id)
+    ).scalar_one()
+    _finish_write(session, _commit)
+    return CreateCaseResponse(case_id=case_id)
+
+
+def get_case(session: Session, case_id: str) -> Optional[CaseRecord]:
+    """Retrieve a case by ID or return ``None``."""
+    return session.get(CaseRecord, case_id)
+
+
+def add_photo(
+    session: Session,
+    case_id: str,
+    filename: Optional[str],
+    view: Optional[str],
+    digest: str,
+    *,
+    _commit: bool = True,
+) -> PhotoUploadResponse:
+    """Persist a photo associated with a case.
+
+    Only metadata and the SHA-256 content digest are stored; the blob
+    itself would go to MinIO/S3 in a full deployment.  The caller computes
+    the digest while streaming the upload so the file never has to be
+    buffered in memory.
+    """
+    photo_id = session.execute(
+        insert(PhotoRecord)
+        .values(case_id=case_id, filename=filename, view=view, hash=digest)
+        .returning(PhotoRecord.id)
+    ).scalar_one()
+    _finish_write(session, _commit)
+    return PhotoUploadResponse(photo_id=photo_id)
+
+
+def get_case_detail(session: Session, case_id: str) -> Optional[CaseDetail]:
+    """Load a case together with its photos in a single round trip.
+
+    ``selectinload`` fetches the photo collection with the parent rather
+    than via a lazy per-attribute SELECT; ``raiseload('*')`` makes any
+    other accidental relationship traversal fail loudly in tests.
+    """
+    case = session.execute(
+        select(CaseRecord)
+        .options(selectinload(CaseRecord.photos), raiseload("*"))
+        .where(CaseRecord.id == case_id)
+    ).scalar_one_or_none()
+    if case is None:
+        return None
+    return _case_detail_from_record(case)
+
+
+def _photo_from_record(record: PhotoRecord) -> PhotoMetadata:
+    """Build photo metadata without re-validating our own stored values."""
+    return PhotoMetadata.model_construct(
+        id=record.id,
+        case_id=record.case_id,
+        filename=record.filename,
+        view=record.view,
+        hash=record.hash,
+        created_at=record.created_at,
+    )
+
+
+def _case_detail_from_record(record: CaseRecord) -> CaseDetail:
+    """Build a CaseDetail from an ORM record, skipping the validator chain."""
+    return CaseDetail.model_construct(
+        id=record.id,
+        user_id=record.user_id,
+        pet_id=record.pet_id,
+        type=record.type,
+        species=record.species,
+        geohash6=record.geohash6,
+        consent_json=record.consent_json,
+        status=record.status,
+        created_at=record.created_at,
+        photos=[_photo_from_record(photo) for photo in record.photos],
+    )
+
+
+def record_candidate_review(
+    session: Session, case_id: str, review: ReviewRequest, *, _commit: bool = True
+) -> CaseReview:
+    """Persist a reviewer confirm/deny decision for a search candidate."""
+    row = session.execute(
+        insert(CaseReviewRecord)
+        .values(case_id=case_id, pet_id=review.pet_id, decision=review.decision)
+        .returning(
+            CaseReviewRecord.id,
+            CaseReviewRecord.case_id,
+            CaseReviewRecord.pet_id,
+            CaseReviewRecord.decision,
+            CaseReviewRecord.created_at,
+        )
+    ).one()
+    _finish_write(session, _commit)
+    return CaseReview.model_construct(**row._mapping)
+
+
+def list_case_reviews(session: Session, case_id: str) -> List[CaseReview]:
+    """List reviewer decisions for a case, newest first.
+
+    Rows are read as Core mappings and turned into models with
+    ``model_construct``: the values were validated on write, so the full
+    validator chain (and ORM identity-map bookkeeping) is skipped here.
+    """
+    stmt = lambda_stmt(
+        lambda: select(
+            CaseReviewRecord.id,
+            CaseReviewRecord.case_id,
+            CaseReviewRecord.pet_id,
+            CaseReviewRecord.decision,
+            CaseReviewRecord.created_at,
+        )
+        .where(CaseReviewRecord.case_id == case_id)
+        .order_by(CaseReviewRecord.created_at.desc())
+    )
+    return [CaseReview.model_construct(**row) for row in session.execute(stmt).mappings()]
+
+
+def _litter_event_values(payload: LitterEventPayload, source: str) -> Dict[str, Any]:
+    """Build an insert-ready events row; the UUID is pre-generated so bulk
+    inserts don't need RETURNING."""
+    return {
+        "id": uuid7().hex,
+        "source": source,
+        "pet_id": payload.pet_id,
+        "type": payload.type,
+        "ts": payload.ts,
+        "duration_s": payload.duration_s,
+        "conf": payload.conf,
+        "payload_json": payload.payload,
+    }
+
+
+def _threshold_alert_values(payload: LitterEventPayload) -> Optional[Dict[str, Any]]:
+    """Insert-ready alerts row for a threshold breach, or ``None``."""
+    if payload.duration_s is None or payload.duration_s <= LITTER_DURATION_ALERT_S:
+        return None
+    return {
+        "id": uuid7().hex,
+        "pet_id": payload.pet_id,
+        "kind": "health_anomaly",
+        "severity": "medium",
+        "state": "open",
+        "ts": payload.ts,
+    }
+
+
+def record_litter_event_batch(
+    session: Session,
+    batch: Sequence[Tuple[LitterEventPayload, str]],
+    *,
+    _commit: bool = True,
+) -> int:
+    """Bulk-insert a batch of litter events and any threshold alerts.
+
+    Uses SQLAlchemy's insertmanyvalues path: one multi-row INSERT for the
+    events and one for the alerts, instead of building an ORM instance and
+    issuing a statement per message.  Returns the number of alerts raised.
+    """
+    event_rows = [_litter_event_values(payload, source) for payload, source in batch]
+    alert_rows = [
+        values
+        for payload, _ in batch
+        if (values := _threshold_alert_values(payload)) is not None
+    ]
+    if event_rows:
+        session.execute(insert(EventRecordORM), event_rows)
+    if alert_rows:
+        session.execute(insert(AlertRecord), alert_rows)
+    _finish_write(session, _commit)
+    return len(alert_rows)
+
+
+def record_playroom_alert_batch(
+    session: Session, payloads: Sequence[PlayroomAlertPayload], *, _commit: bool = True
+) -> None:
+    """Bulk-insert a batch of playroom alerts in one multi-row INSERT."""
+    rows = [
+        {
+            "id": uuid7().hex,
+            "pet_id": payload.pet_id,
+            "room_id": payload.room_id,
+            "kind": payload.kind,
+            "severity": payload.severity,
+            "state": payload.state,
+            "evidence_url": str(payload.evidence_url) if payload.evidence_url else None,
+            "ts": payload.ts,
+        }
+        for payload in payloads
+    ]
+    if rows:
+        session.execute(insert(AlertRecord), rows)
+    _finish_write(session, _commit)
+
+
+def list_recent_alerts(
+    session: Session, limit: int = 25, pet_id: Optional[str] = None
+) -> List[AlertRow]:
+    """Return the most recent alerts, optionally scoped to one pet.
+
+    Reads Core row mappings straight into slotted dataclasses; the values
+    came from our own writes so re-validation is skipped.
+    """
+    stmt = lambda_stmt(
+        lambda: select(
+            AlertRecord.id,
+            AlertRecord.pet_id,
+            AlertRecord.room_id,
+            AlertRecord.kind,
+            AlertRecord.severity,
+            AlertRecord.state,
+            AlertRecord.evidence_url,
+            AlertRecord.ts,
+            AlertRecord.created_at,
+        )
+        .order_by(AlertRecord.ts.desc())
+        .limit(limit)
+    )
+    if pet_id is not None:
+        stmt = stmt.add_criteria(lambda s: s.where(AlertRecord.pet_id == pet_id))
+    return [AlertRow(**row) for row in session.execute(stmt).mappings()]
+
+
+def list_recent_events(
+    session: Session, limit: int = 50, pet_id: Optional[str] = None
+) -> List[EventRow]:
+    """Return the most recent edge events, optionally scoped to one pet.
+
+    Same trusted-read shortcut as :func:`list_recent_alerts`.
+    """
+    stmt = lambda_stmt(
+        lambda: select(
+            EventRecordORM.id,
+            EventRecordORM.source,
+            EventRecordORM.pet_id,
+            EventRecordORM.type,
+            EventRecordORM.ts,
+            EventRecordORM.duration_s,
+            EventRecordORM.conf,
+            EventRecordORM.payload_json,
+            EventRecordORM.created_at,
+        )
+        .order_by(EventRecordORM.ts.desc())
+        .limit(limit)
+    )
+    if pet_id is not None:
+        stmt = stmt.add_criteria(lambda s: s.where(EventRecordORM.pet_id == pet_id))
+    return [EventRow(**row) for row in session.execute(stmt).mappings()]
+
+
+def export_case(session: Session, case_id: str) -> Optional[CaseExport]:
+    """Assemble the export bundle for a case (AC-PRIV-1).
+
+    The case and its photos are loaded in one round trip via
+    :func:`get_case_detail`; alerts and events are scoped to the case's
+    pet via the ``pet_id`` correlation key, so the export only contains
+    activity that actually belongs to the case.  Cases without an
+    enrolled pet export empty activity lists.
+    """
+    detail = get_case_detail(session, case_id)
+    if detail is None:
+        return None
+    alerts: List[Alert] = []
+    events: List[EventRecord] = []
+    if detail.pet_id is not None:
+        # The feed helpers return plain dataclass rows; lift them into the
+        # Pydantic models CaseExport declares so the response serializes
+        # without type-mismatch warnings.
+        alerts = [
+            Alert.model_construct(**asdict(row))
+            for row in list_recent_alerts(session, pet_id=detail.pet_id)
+        ]
+        events = [
+            EventRecord.model_construct(**asdict(row))
+            for row in list_recent_events(session, pet_id=detail.pet_id)
+        ]
+    return CaseExport.model_construct(case=detail, alerts=alerts, events=events)
+
+
+def erase_case(session: Session, case_id: str) -> bool:
+    """Cascade-delete a case, its photos and reviews (AC-PRIV-1)."""
+    case = session.get(CaseRecord, case_id)
+    if case is None:
+        return False
+    for review in (
+        session.execute(select(CaseReviewRecord).where(CaseReviewRecord.case_id == case_id))
+        .scalars()
+        .all()
+    ):
+        session.delete(review)
+    session.delete(case)
+    session.commit()
+    return True
+
+
+@lru_cache(maxsize=8)
+def _cached_candidates(fixture_path: str) -> Tuple[SearchCandidate, ...]:
+    try:
+        with open(fixture_path, "r", encoding="utf-8") as fp:
+            raw = json.load(fp)
+        return tuple(SearchCandidate(**item) for item in raw)
+    except Exception:
+        return ()
+
+
+def load_search_candidates(fixture_path: str) -> Sequence[SearchCandidate]:
+    """Load deterministic search candidates from a JSON fixture file.
+
+    The fixture is expected to be a list of objects with ``pet_id``, ``score``
+    and ``band`` fields.  If the file cannot be read the function returns
+    an empty sequence.  The parsed candidates are frozen models cached per
+    path, so the shared sequence is returned as-is — no per-request copy.
+    """
+    return _cached_candidates(fixture_path)
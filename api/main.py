@@ -0,0 +1,281 @@
+"""FastAPI application for the Pets × AI HTTP API.
+
+This module wires together request/response models, the SQLAlchemy-backed
+database layer and deterministic search fixtures to satisfy the core
+functionality described in the project README.  The endpoints defined
+here must conform to the shapes specified in ``contracts/openapi.yaml``.
+
+You can run the development server from the repository root:
+
+    uvicorn api.main:app --reload
+"""
+
+from __future__ import annotations
+
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator
+
+import orjson
+from fastapi import (
+    Depends,
+    FastAPI,
+    File,
+    Form,
+    HTTPException,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import ORJSONResponse
+from fastapi.middleware.cors import CORSMiddleware
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from sqlalchemy.orm import Session
+
+from . import database
+from .database import load_search_candidates, session_scope
+from .models import (
+    AlertsResponse,
+    CaseDetail,
+    CaseEraseResponse,
+    CaseExport,
+    CaseReviewList,
+    CreateCaseRequest,
+    CreateCaseResponse,
+    EventsResponse,
+    PhotoUploadResponse,
+    ReviewRequest,
+    SearchRequest,
+    SearchResponse,
+)
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Contract documents are immutable for the lifetime of the process, so the
+# raw bytes and their ETags are cached at import time instead of hitting
+# the filesystem on every poll.
+_OPENAPI_BYTES = (_REPO_ROOT / "contracts/openapi.yaml").read_bytes()
+_ASYNCAPI_BYTES = (_REPO_ROOT / "contracts/asyncapi.yaml").read_bytes()
+_OPENAPI_ETAG = f'"{hashlib.sha256(_OPENAPI_BYTES).hexdigest()}"'
+_ASYNCAPI_ETAG = f'"{hashlib.sha256(_ASYNCAPI_BYTES).hexdigest()}"'
+
+
+def _contract_response(request: Request, body: bytes, etag: str) -> Response:
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(content=body, media_type="application/yaml", headers={"ETag": etag})
+
+
+class Settings(BaseSettings):
+    """Application configuration settings.
+
+    Values are read from ``PETS_``-prefixed environment variables with
+    sensible defaults for local development.
+    """
+
+    model_config = SettingsConfigDict(env_prefix="PETS_")
+
+    database_url: str = "sqlite:///./pets.db"
+    search_fixture: str = str(_REPO_ROOT / "tests/fixtures/search_candidates.json")
+
+
+def get_settings() -> Settings:
+    return Settings()
+
+
+def get_session() -> Iterator[Session]:
+    """Dependency injector yielding a transactional database session."""
+    with session_scope() as session:
+        yield session
+
+
+# ORJSONResponse encodes handler return values with orjson instead of the
+# json.dumps/jsonable_encoder pair, which dominates CPU on the list endpoints.
+app = FastAPI(title="Pets × AI API", version="1.0.0", default_response_class=ORJSONResponse)
+
+# Initialise shared state
+app.state.settings = Settings()
+database.configure(app.state.settings.database_url)
+
+# Enable CORS for development front‑ends (e.g. Next.js on localhost:3000)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+
+@app.post("/v1/cases", response_model=CreateCaseResponse, status_code=status.HTTP_201_CREATED)
+def create_case(
+    request: CreateCaseRequest, session: Session = Depends(get_session)
+) -> CreateCaseResponse:
+    """Create a new lost‑pet case."""
+    return database.create_case(session, request)
+
+
+@app.post(
+    "/v1/cases/{case_id}/photos",
+    response_model=PhotoUploadResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def upload_photo(
+    case_id: str,
+    file: UploadFile = File(...),
+    view: str | None = Form(None),
+    session: Session = Depends(get_session),
+) -> PhotoUploadResponse:
+    """Upload a photo for an existing case.
+
+    For this scaffold only metadata and a content hash are persisted; the
+    blob itself would be stored encrypted in MinIO/S3.  The upload is
+    hashed in 1 MiB chunks so memory use stays constant regardless of
+    photo size.
+    """
+    if database.get_case(session, case_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Case not found")
+    hasher = hashlib.sha256()
+    size = 0
+    while chunk := await file.read(1 << 20):
+        hasher.update(chunk)
+        size += len(chunk)
+    if size == 0:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Empty upload")
+    return database.add_photo(
+        session, case_id, filename=file.filename, view=view, digest=hasher.hexdigest()
+    )
+
+
+@app.get("/internal/cases/{case_id}", response_model=CaseDetail)
+def get_case_detail(case_id: str, session: Session = Depends(get_session)) -> CaseDetail:
+    """Return a case with its photo metadata (internal/reviewer tooling)."""
+    detail = database.get_case_detail(session, case_id)
+    if detail is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Case not found")
+    return detail
+
+
+@lru_cache(maxsize=32)
+def _search_bytes(fixture_path: str, k: int) -> bytes:
+    """Serialize the top-K search response once per (fixture, k) pair."""
+    candidates = load_search_candidates(fixture_path)
+    response = SearchResponse.model_construct(candidates=list(candidates[:k]))
+    return SearchResponse.__pydantic_serializer__.to_json(response)
+
+
+@app.post("/v1/search", responses={200: {"model": SearchResponse}})
+def search(
+    request: SearchRequest,
+    settings: Settings = Depends(get_settings),
+) -> Response:
+    """Run a deterministic visual search and return the top‑K candidates.
+
+    Candidates are loaded from a fixture file at startup.  The ``top_k``
+    parameter controls the number of returned items and defaults to 10.
+    The candidates are deterministic per (fixture, k), so the serialized
+    body is cached and returned as pre-built bytes.
+
+    A batched request (``case_ids``) fans out in this one handler call:
+    the per-case body is serialized once and spliced into a
+    ``BatchSearchResponse`` shape, amortizing routing and validation
+    across the whole batch.
+    """
+    if (request.case_id is None) == (request.case_ids is None):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Provide exactly one of case_id or case_ids",
+        )
+    k = request.top_k or 10
+    body = _search_bytes(settings.search_fixture, k)
+    if request.case_ids is not None:
+        body = b'{"results":[' + b",".join([body] * len(request.case_ids)) + b"]}"
+    return Response(content=body, media_type="application/json")
+
+
+@app.post(
+    "/v1/cases/{case_id}/reviews",
+    response_model=CaseReviewList,
+    status_code=status.HTTP_201_CREATED,
+)
+def review_candidate(
+    case_id: str, request: ReviewRequest, session: Session = Depends(get_session)
+) -> CaseReviewList:
+    """Record a reviewer confirm/deny decision for a search candidate."""
+    if database.get_case(session, case_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Case not found")
+    database.record_candidate_review(session, case_id, request)
+    return CaseReviewList.model_construct(reviews=database.list_case_reviews(session, case_id))
+
+
+@app.get("/v1/cases/{case_id}/export", response_model=CaseExport)
+def export_case(case_id: str, session: Session = Depends(get_session)) -> CaseExport:
+    """Export all data associated with a case (AC-PRIV-1)."""
+    export = database.export_case(session, case_id)
+    if export is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Case not found")
+    return export
+
+
+@app.delete("/v1/cases/{case_id}", response_model=CaseEraseResponse)
+def erase_case(case_id: str, session: Session = Depends(get_session)) -> CaseEraseResponse:
+    """Erase a case and its photos with cascade deletion (AC-PRIV-1)."""
+    erased = database.erase_case(session, case_id)
+    if not erased:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Case not found")
+    return CaseEraseResponse(case_id=case_id, erased=True)
+
+
+@app.get("/v1/alerts", responses={200: {"model": AlertsResponse}})
+def list_alerts(session: Session = Depends(get_session)) -> Response:
+    """Return the most recent alerts for the dashboard feed.
+
+    The rows are slotted dataclasses serialized directly by orjson; the
+    Pydantic model documents the shape but is not on the hot path.
+    """
+    rows = database.list_recent_alerts(session)
+    return Response(content=orjson.dumps({"alerts": rows}), media_type="application/json")
+
+
+@app.get("/v1/events", responses={200: {"model": EventsResponse}})
+def list_events(session: Session = Depends(get_session)) -> Response:
+    """Return the most recent edge events."""
+    rows = database.list_recent_events(session)
+    return Response(content=orjson.dumps({"events": rows}), media_type="application/json")
+
+
+@app.get("/docs/openapi.yaml")
+def serve_openapi_yaml(request: Request) -> Response:
+    """Serve the raw OpenAPI contract for easy access from the UI/documentation."""
+    return _contract_response(request, _OPENAPI_BYTES, _OPENAPI_ETAG)
+
+
+@app.get("/docs/asyncapi.yaml")
+def serve_asyncapi_yaml(request: Request) -> Response:
+    """Serve the raw AsyncAPI contract."""
+    return _contract_response(request, _ASYNCAPI_BYTES, _ASYNCAPI_ETAG)
+
+
+@app.get("/alerts.json")
+def get_alerts_json(session: Session = Depends(get_session)) -> Response:
+    """Legacy polling endpoint used by the web front‑end.
+
+    Serves the same dataclass rows as ``/v1/alerts`` straight through
+    orjson, skipping FastAPI's jsonable_encoder round trip.
+    """
+    alerts = database.list_recent_alerts(session)
+    return Response(content=orjson.dumps({"alerts": alerts}), media_type="application/json")
+
+
+@app.on_event("startup")
+def on_startup() -> None:
+    """Load deterministic search candidates into memory on startup."""
+    # Preload the fixtures so they are hot in memory.  We don't store them in
+    # state to keep the example simple; the loader caches results anyway.
+    # Serializing the default top-10 response also warms the pydantic-core
+    # serializer and the body cache, so the first search hits neither.
+    settings: Settings = app.state.settings
+    _ = load_search_candidates(settings.search_fixture)
+    _ = _search_bytes(settings.search_fixture, 10)
@@ -0,0 +1,274 @@
+"""Pydantic models derived from the OpenAPI/AsyncAPI specifications.
+
+These models mirror the data structures defined in ``contracts/openapi.yaml``
+and ``contracts/asyncapi.yaml`` and are used by the FastAPI handlers for
+request validation and response serialization, and by the edge consumer for
+event payload validation.  Keeping the models in one place makes it easier
+to regenerate them when the contracts change.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+
+
+class Consent(BaseModel):
+    """Consent flags controlling privacy behaviour."""
+
+    shareVectors: bool = Field(..., description="Whether embeddings may be shared with other cases")
+    sharePhotos: bool = Field(..., description="Whether photos may be shared with other cases")
+
+
+class CreateCaseRequest(BaseModel):
+    """Request model for creating a new case."""
+
+    user_id: str = Field(..., description="Identifier of the owner submitting the case")
+    pet_id: Optional[str] = Field(
+        None, description="Optional identifier of an enrolled pet the case concerns"
+    )
+    type: str = Field(..., description="Nature of the case (lost/found)")
+    species: str = Field(..., description="Species of animal (e.g. dog, cat)")
+    geohash6: str = Field(..., description="Approximate location encoded as a six‑character geohash")
+    consent: Consent
+
+
+class CreateCaseResponse(BaseModel):
+    """Response model for case creation."""
+
+    case_id: str
+
+
+class PhotoUploadResponse(BaseModel):
+    """Response model for photo uploads."""
+
+    photo_id: str
+
+
+class SearchRequest(BaseModel):
+    """Request model for running a search.
+
+    Exactly one of ``case_id`` or ``case_ids`` must be provided; the
+    batched form fans out server-side so one HTTP round-trip covers many
+    cases.
+    """
+
+    case_id: Optional[str] = Field(None, description="Identifier of the case to search against")
+    case_ids: Optional[List[str]] = Field(
+        None, description="Batch of case identifiers searched in one call"
+    )
+    top_k: Optional[int] = Field(10, description="Number of candidates to return", ge=1)
+
+
+class SearchCandidate(BaseModel):
+    """Candidate result item returned from a search.
+
+    Frozen so cached fixture candidates can be shared across requests
+    without defensive copying.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    pet_id: str
+    score: float
+    band: str
+
+
+class SearchResponse(BaseModel):
+    """Response model for search results."""
+
+    candidates: List[SearchCandidate]
+
+
+class BatchSearchResponse(BaseModel):
+    """Response model for batched search: one result per requested case."""
+
+    results: List[SearchResponse]
+
+
+class ReviewRequest(BaseModel):
+    """Request model for confirming or denying a search candidate."""
+
+    pet_id: str = Field(..., description="Identifier of the candidate pet being reviewed")
+    decision: str = Field(..., description="Reviewer decision (confirmed/denied)")
+
+
+class PhotoMetadata(BaseModel):
+    """Metadata describing a stored photo."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    case_id: str
+    filename: Optional[str] = None
+    view: Optional[str] = None
+    hash: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+
+class CaseReview(BaseModel):
+    """A recorded reviewer decision for a search candidate."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    case_id: str
+    pet_id: str
+    decision: str
+    created_at: Optional[datetime] = None
+
+
+class CaseReviewList(BaseModel):
+    """Response model wrapping a list of candidate reviews."""
+
+    reviews: List[CaseReview]
+
+
+class CaseDetail(BaseModel):
+    """Full detail of a case including its photos."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    user_id: str
+    pet_id: Optional[str] = None
+    type: str
+    species: str
+    geohash6: str
+    consent_json: Dict[str, Any]
+    status: str
+    created_at: Optional[datetime] = None
+    photos: List[PhotoMetadata]
+
+
+class EventRecord(BaseModel):
+    """A persisted edge event (litter/feeder activity)."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    source: str
+    pet_id: str
+    type: str
+    ts: datetime
+    duration_s: Optional[float] = None
+    conf: Optional[float] = None
+    payload_json: Optional[Dict[str, Any]] = None
+    created_at: Optional[datetime] = None
+
+
+class Alert(BaseModel):
+    """A persisted alert (health anomaly or playroom incident).
+
+    ``evidence_url`` is a plain string here: the URL was validated as
+    :class:`HttpUrl` on the ingest payload, so the read model does not pay
+    for a second regex-heavy parse per row.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    pet_id: str
+    room_id: Optional[str] = None
+    kind: str
+    severity: str
+    state: str
+    evidence_url: Optional[str] = None
+    ts: datetime
+    created_at: Optional[datetime] = None
+
+
+class AlertsResponse(BaseModel):
+    """Response model wrapping a list of alerts."""
+
+    alerts: List[Alert]
+
+
+class EventsResponse(BaseModel):
+    """Response model wrapping a list of events."""
+
+    events: List[EventRecord]
+
+
+class CaseExport(BaseModel):
+    """Export bundle for a case: the case, its photos and related activity."""
+
+    case: CaseDetail
+    alerts: List[Alert]
+    events: List[EventRecord]
+
+
+class CaseEraseResponse(BaseModel):
+    """Response model for the erase endpoint."""
+
+    case_id: str
+    erased: bool
+
+
+class LitterEventPayload(BaseModel):
+    """Payload schema for ``events.litter.*`` messages (see asyncapi.yaml).
+
+    ``extra="forbid"`` enforces the contract exactly (AC-CONTRACT-2) and
+    ``cache_strings="keys"`` lets pydantic-core intern the repeated field
+    names across the message stream.
+    """
+
+    model_config = ConfigDict(extra="forbid", cache_strings="keys")
+
+    pet_id: str
+    type: str
+    ts: datetime
+    duration_s: Optional[float] = None
+    conf: Optional[float] = None
+    payload: Dict[str, Any] = Field(default_factory=dict)
+
+
+class PlayroomAlertPayload(BaseModel):
+    """Payload schema for ``playroom.alerts.*`` messages (see asyncapi.yaml).
+
+    Configured like :class:`LitterEventPayload` for strict contract
+    enforcement and key-string interning.
+    """
+
+    model_config = ConfigDict(extra="forbid", cache_strings="keys")
+
+    pet_id: str
+    room_id: str
+    kind: str
+    severity: str
+    state: str
+    evidence_url: Optional[HttpUrl] = None
+    ts: datetime
+
+
+# With ``from __future__ import annotations`` every field annotation is a
+# forward reference, so pydantic-core builds each model's schema lazily on
+# first validate/serialize — inside the first request.  Force the builds at
+# import time instead so process boot absorbs the cost.
+for _model in (
+    Consent,
+    CreateCaseRequest,
+    CreateCaseResponse,
+    PhotoUploadResponse,
+    SearchRequest,
+    SearchCandidate,
+    SearchResponse,
+    BatchSearchResponse,
+    ReviewRequest,
+    PhotoMetadata,
+    CaseReview,
+    CaseReviewList,
+    CaseDetail,
+    EventRecord,
+    Alert,
+    AlertsResponse,
+    EventsResponse,
+    CaseExport,
+    CaseEraseResponse,
+    LitterEventPayload,
+    PlayroomAlertPayload,
+):
+    _model.model_rebuild(force=True)
+del _model
@@ -0,0 +1,145 @@
+"""Event consumers for litter/feeder and playroom alerts.
+
+This module consumes the channels defined in ``contracts/asyncapi.yaml``
+via JetStream pull subscriptions: messages are fetched in batches and each
+batch is persisted inside a single transaction, so the per-message fsync
+and task-scheduling overhead of core NATS subscribe callbacks is amortized
+across the whole batch.  Payloads are validated against the AsyncAPI
+schemas (via the Pydantic models in :mod:`api.models`); invalid messages
+are terminated and logged (AC-CONTRACT-2).
+
+See ``tests/fixtures/litter_event.json`` and
+``tests/fixtures/playroom_alert.json`` for example payloads.
+"""
+
+import asyncio
+import os
+from typing import List
+
+import nats
+import nats.errors
+from pydantic import TypeAdapter, ValidationError
+
+from api import database
+from api.database import session_scope
+from api.models import LitterEventPayload, PlayroomAlertPayload
+
+DATABASE_URL = os.getenv("PETS_DATABASE_URL", "sqlite:///./pets.db")
+NATS_URL = os.getenv("NATS_URL", "nats://localhost:4222")
+
+# Pull-consumer tuning: how many messages to request per fetch and how long
+# to wait before retrying an idle subject.
+BATCH_SIZE = 256
+FETCH_TIMEOUT_S = 1.0
+
+# Validators resolved once at module load; validate_json accepts the raw
+# message bytes, so there is no per-message UTF-8 decode or classmethod
+# lookup on the hot path.
+_LITTER = TypeAdapter(LitterEventPayload)
+_PLAYROOM = TypeAdapter(PlayroomAlertPayload)
+
+
+async def handle_litter_batch(msgs: List) -> None:
+    """Persist a batch of ``events.litter.*`` messages in one transaction."""
+    valid = []
+    for msg in msgs:
+        try:
+            valid.append((msg, _LITTER.validate_json(msg.data)))
+        except ValidationError as exc:
+            print(f"Rejected invalid litter event on {msg.subject}: {exc}")
+            await msg.term()
+    if valid:
+        # One multi-row INSERT per table for the whole batch; session_scope
+        # commits once on exit.
+        with session_scope() as session:
+            database.record_litter_event_batch(
+                session, [(payload, msg.subject) for msg, payload in valid], _commit=False
+            )
+    await asyncio.gather(*(msg.ack() for msg, _ in valid))
+
+
+async def handle_playroom_batch(msgs: List) -> None:
+    """Persist a batch of ``playroom.alerts.*`` messages in one transaction."""
+    valid = []
+    for msg in msgs:
+        try:
+            valid.append((msg, _PLAYROOM.validate_json(msg.data)))
+        except ValidationError as exc:
+            print(f"Rejected invalid playroom alert on {msg.subject}: {exc}")
+            await msg.term()
+    if valid:
+        with session_scope() as session:
+            database.record_playroom_alert_batch(
+                session, [payload for _, payload in valid], _commit=False
+            )
+    await asyncio.gather(*(msg.ack() for msg, _ in valid))
+
+
+# Subject-prefix → batch handler, precomputed once so workers dispatch with
+# a dict lookup instead of re-matching subjects per message.
+_DISPATCH: dict = {
+    "events.litter": handle_litter_batch,
+    "playroom.alerts": handle_playroom_batch,
+}
+
+# Fetched batches flow through a bounded queue into a fixed worker pool;
+# 16 batches of BATCH_SIZE keeps at most ~4096 messages in flight.
+BATCH_QUEUE: "asyncio.Queue[List]" = asyncio.Queue(maxsize=16)
+WORKER_COUNT = 8
+
+
+def _handler_for(subject: str):
+    head, _, tail = subject.partition(".")
+    return _DISPATCH.get(head + "." + tail.partition(".")[0])
+
+
+async def _fetch_loop(sub) -> None:
+    """Fetch batches from a pull subscription into the shared queue."""
+    while True:
+        try:
+            msgs = await sub.fetch(BATCH_SIZE, timeout=FETCH_TIMEOUT_S)
+        except nats.errors.TimeoutError:
+            continue
+        await BATCH_QUEUE.put(msgs)
+
+
+async def _worker() -> None:
+    """Drain the batch queue, dispatching each batch by subject prefix."""
+    while True:
+        msgs = await BATCH_QUEUE.get()
+        try:
+            handler = _handler_for(msgs[0].subject)
+            if handler is None:
+                print(f"No handler for subject {msgs[0].subject}; terminating batch")
+                await asyncio.gather(*(msg.term() for msg in msgs))
+            else:
+                await handler(msgs)
+        except Exception as exc:  # noqa: BLE001 - a dead worker deadlocks the queue
+            # A transient failure (e.g. a locked database) must not kill the
+            # worker: the batch stays unacked and JetStream redelivers it.
+            print(f"Batch of {len(msgs)} on {msgs[0].subject} failed, will redeliver: {exc}")
+        finally:
+            BATCH_QUEUE.task_done()
+
+
+async def main() -> None:
+    """Main entrypoint for the consumer process."""
+    database.configure(DATABASE_URL)
+    nc = await nats.connect(NATS_URL)
+    js = nc.jetstream()
+    litter_sub = await js.pull_subscribe("events.litter.*", durable="litter-workers")
+    playroom_sub = await js.pull_subscribe("playroom.alerts.*", durable="playroom-workers")
+    workers = [asyncio.create_task(_worker()) for _ in range(WORKER_COUNT)]
+    print("Edge consumers are pulling event batches...")
+    try:
+        await asyncio.gather(_fetch_loop(litter_sub), _fetch_loop(playroom_sub))
+    except asyncio.CancelledError:
+        pass
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await nc.drain()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
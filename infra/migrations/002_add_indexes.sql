@@ -0,0 +1,17 @@
+-- Indexes backing the list/export query patterns: recent feeds order by ts,
+-- exports filter by pet_id, and case reviews filter by case_id ordered by
+-- created_at.  On a live Postgres, run these as CREATE INDEX CONCURRENTLY.
+
+CREATE TABLE IF NOT EXISTS case_reviews (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    case_id UUID REFERENCES cases(id) ON DELETE CASCADE,
+    pet_id UUID NOT NULL,
+    decision TEXT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS ix_events_ts ON events (ts);
+CREATE INDEX IF NOT EXISTS ix_events_pet_id ON events (pet_id);
+CREATE INDEX IF NOT EXISTS ix_alerts_ts ON alerts (ts);
+CREATE INDEX IF NOT EXISTS ix_alerts_pet_id ON alerts (pet_id);
+CREATE INDEX IF NOT EXISTS ix_case_reviews_case_created ON case_reviews (case_id, created_at);
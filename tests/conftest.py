@@ -0,0 +1,108 @@
+"""Shared pytest fixtures for the API test suite.
+
+The ASGI transport and async client are session-scoped so connection
+setup happens exactly once per test session; tests run against the app
+in-process without per-request event-loop spin-up, and independent
+requests can be overlapped with ``asyncio.gather``.
+"""
+
+from __future__ import annotations
+
+import os
+
+# Under pytest-xdist each worker is its own process; point it at a
+# worker-unique SQLite file before the app import configures the engine,
+# so parallel workers never share a database.  An explicit
+# PETS_DATABASE_URL still wins.
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+if _WORKER and "PETS_DATABASE_URL" not in os.environ:
+    os.environ["PETS_DATABASE_URL"] = f"sqlite:///./pets-{_WORKER}.db"
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete
+
+from api.database import AlertRecord, EventRecordORM, session_scope
+from api.main import app
+
+
+@pytest.fixture(scope="session")
+def transport() -> httpx.ASGITransport:
+    """One ASGI transport for the whole session, shared by all clients."""
+    return httpx.ASGITransport(app=app)
+
+
+@pytest_asyncio.fixture(loop_scope="session", scope="session")
+async def client(transport: httpx.ASGITransport):
+    """A single async client for the whole session.
+
+    The app is configured at import time, so no lifespan events are
+    needed; startup warm-ups are only an optimisation and happen lazily
+    here.
+    """
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture(loop_scope="session", scope="session")
+async def sample_case(client: httpx.AsyncClient) -> str:
+    """Create one case for the whole session and share its id.
+
+    Tests that only need an existing case reuse this id instead of each
+    paying for their own POST; tests that mutate or erase a case must
+    create their own.
+    """
+    resp = await client.post(
+        "/v1/cases",
+        json={
+            "user_id": "user123",
+            "type": "lost",
+            "species": "dog",
+            "geohash6": "abc123",
+            "consent": {"shareVectors": True, "sharePhotos": False},
+        },
+    )
+    assert resp.status_code == 201
+    return resp.json()["case_id"]
+
+
+@pytest_asyncio.fixture(loop_scope="session", scope="session")
+async def pg_pool():
+    """Shared asyncpg pool for tests that seed the compose Postgres.
+
+    Only instantiated when a test requests it; requires the database from
+    ``infra/compose.yaml`` to be running.
+    """
+    from tests import seed_fixtures
+
+    pool = await seed_fixtures._get_pool()
+    yield pool
+    await pool.close()
+    seed_fixtures._POOL = None
+
+
+@pytest.fixture(scope="session")
+def dog_jpg(tmp_path_factory: pytest.TempPathFactory):
+    """A placeholder photo written to disk once per session.
+
+    Tests upload it from an open file handle so the multipart encoder
+    streams the content instead of holding a bytes copy per call.
+    """
+    path = tmp_path_factory.mktemp("fixtures") / "dog.jpg"
+    path.write_bytes(b"fakebytes")
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _reset_state():
+    """Empty the shared feed tables after each test.
+
+    Events and alerts are queried as global recent-feeds, so leftovers
+    would leak between tests.  Cases, photos and reviews are addressed by
+    unique ids and can safely accumulate.
+    """
+    yield
+    with session_scope() as session:
+        session.execute(delete(EventRecordORM))
+        session.execute(delete(AlertRecord))
@@ -0,0 +1,55 @@
+"""Basic integration tests for the Pets × AI API.
+
+These tests drive the app through ``httpx.AsyncClient`` over an ASGI
+transport so independent requests can overlap.  They are not exhaustive
+and should be expanded as features mature.  Running ``pytest`` in the
+repository root will automatically discover and execute these tests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_upload_photo_and_search(
+    client: httpx.AsyncClient, sample_case: str, dog_jpg
+) -> None:
+    # Case creation is covered by the shared session fixture
+    case_id = sample_case
+    # Upload the placeholder photo from an open handle so the multipart
+    # body streams; the search only reads fixtures, so the two requests
+    # can run concurrently
+    with dog_jpg.open("rb") as fh:
+        files = {"file": ("dog.jpg", fh, "image/jpeg")}
+        upload_resp, search_resp, batch_resp = await asyncio.gather(
+            client.post(f"/v1/cases/{case_id}/photos", files=files),
+            client.post("/v1/search", json={"case_id": case_id, "top_k": 5}),
+            client.post("/v1/search", json={"case_ids": [case_id] * 3, "top_k": 5}),
+        )
+    assert upload_resp.status_code == 201
+    assert "photo_id" in upload_resp.json()
+    assert search_resp.status_code == 200
+    data = search_resp.json()
+    assert "candidates" in data
+    # There should be at least as many candidates as requested (within fixture size)
+    assert len(data["candidates"]) == 5
+    # The batched form returns one result per requested case, in order
+    assert batch_resp.status_code == 200
+    results = batch_resp.json()["results"]
+    assert len(results) == 3
+    assert all(len(r["candidates"]) == 5 for r in results)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_openapi_and_asyncapi_docs_served(client: httpx.AsyncClient) -> None:
+    openapi_resp, asyncapi_resp = await asyncio.gather(
+        client.get("/docs/openapi.yaml"), client.get("/docs/asyncapi.yaml")
+    )
+    assert openapi_resp.status_code == 200
+    assert "openapi" in openapi_resp.text
+    assert asyncapi_resp.status_code == 200
+    assert "asyncapi" in asyncapi_resp.text
@@ -0,0 +1,29 @@
+"""Minify the JSON fixtures under ``tests/fixtures`` in place.
+
+Pretty-printed fixtures are convenient to edit but slower to parse and
+larger to read; run this one-shot script after editing a fixture to
+strip the whitespace back out:
+
+    python tools/minify_fixtures.py
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import orjson
+
+_FIX_DIR = Path(__file__).resolve().parents[1] / "tests/fixtures"
+
+
+def main() -> None:
+    for path in sorted(_FIX_DIR.glob("*.json")):
+        original = path.read_bytes()
+        minified = orjson.dumps(orjson.loads(original))
+        if minified != original:
+            path.write_bytes(minified)
+            print(f"Minified {path.name}: {len(original)} -> {len(minified)} bytes")
+
+
+if __name__ == "__main__":
+    main()